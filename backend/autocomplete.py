@@ -0,0 +1,251 @@
+import re
+import threading
+from bisect import bisect_left
+from itertools import islice
+
+
+#Default number of suggestions returned per autocomplete request (constant).
+SUGGESTIONS_LIMIT = 10
+#Upper bound on the number of questions held in the in-memory index (constant).
+#Once reached, the oldest indexed question is evicted for each new one (search_questions() still finds it).
+MAX_INDEXED_QUESTIONS = 200000
+#Tokens are truncated to this many characters, bounding the depth of the trie (constant).
+MAX_TOKEN_LENGTH = 32
+#Only the first this-many distinct words of a question are indexed, bounding the trie entries per question (constant).
+MAX_TOKENS_PER_QUESTION = 32
+#Question text is truncated to this many characters before being stored and indexed (constant).
+MAX_QUESTION_LENGTH = 500
+#Upper bound on the trie nodes and question ids examined by a single search (constant).
+#Keeps lookups in the microsecond range when matches are sparse, at the cost of returning fewer than 'limit' suggestions.
+MAX_POSTINGS_VISITED = 250
+
+#Words are runs of Unicode letters/digits, optionally joined by apostrophes (so "Who's" is a single token).
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens, truncated to MAX_TOKEN_LENGTH characters.
+
+    Args:
+    * text: String to split (e.g. question text or a partially typed search term).
+
+    Returns:
+    * tokens: List of tokens (str), in order of appearance.
+    """
+    return [token[:MAX_TOKEN_LENGTH] for token in TOKEN_PATTERN.findall(str(text).lower())]
+
+
+class TrieNode:
+    """
+    Single character node of the QuestionTrie.
+    'ids' holds the ids of questions containing the word that ends at this node.
+    A dict is used as an insertion-ordered set, so lookups can stop after 'limit' ids without sorting.
+    'count' is the number of ids held by this node and all of its descendants.
+    """
+    __slots__ = ('children', 'ids', 'count')
+
+    def __init__(self):
+        self.children = {}
+        self.ids = {}
+        self.count = 0
+
+
+class QuestionTrie:
+    """
+    In-memory prefix index over the words of question text, used for as-you-type suggestions.
+    Each word of a question is inserted into the trie; a lookup walks the typed prefix and
+    collects question ids from the matching subtree, so cost depends on the prefix and limit
+    rather than on the number of questions in the database.
+    Empty branches are pruned on removal so every leaf holds at least one question id.
+    """
+
+    def __init__(self, max_questions=MAX_INDEXED_QUESTIONS):
+        self.root = TrieNode()
+        self.max_questions = max_questions
+        #id:question text (returned in suggestions, oldest first) and id:sorted tokens (used for removal and prefix checks).
+        self.questions = {}
+        self.tokens = {}
+        self.built = False
+        self.lock = threading.Lock()
+        self.build_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.questions)
+
+    def build(self, selection):
+        """
+        Replace the contents of the index with the provided questions.
+        Questions should be ordered by id so that older questions are suggested (and evicted) first.
+        The new index is built separately and swapped in, so concurrent searches never see a partial index.
+
+        Args:
+        * selection: Iterable of Question objects (models.py).
+        """
+        index = QuestionTrie(self.max_questions)
+        for question in selection:
+            index._insert(question.id, question.question)
+        with self.lock:
+            self.root = index.root
+            self.questions = index.questions
+            self.tokens = index.tokens
+            self.built = True
+
+    def ensure_built(self, load):
+        """
+        Build the index on first use.
+
+        Args:
+        * load: Function returning the questions to index (see build()).
+        """
+        if self.built:
+            return
+        with self.build_lock:
+            if not self.built:
+                self.build(load())
+
+    def insert(self, question_id, text):
+        """
+        Add a question to the index (replacing any existing entry with the same id).
+        If the index is full, the oldest indexed question is evicted.
+        Only the first MAX_QUESTION_LENGTH characters and MAX_TOKENS_PER_QUESTION distinct words are kept.
+
+        Args:
+        * question_id: Id of the question (int).
+        * text: Question text (str).
+        """
+        with self.lock:
+            self._insert(question_id, text)
+
+    def _insert(self, question_id, text):
+        if question_id in self.questions:
+            self._remove(question_id)
+        elif len(self.questions) >= self.max_questions:
+            self._remove(next(iter(self.questions)))
+        text = str(text)[:MAX_QUESTION_LENGTH]
+        #dict.fromkeys() drops repeated words while keeping order of appearance.
+        tokens = tuple(sorted(islice(dict.fromkeys(tokenize(text)), MAX_TOKENS_PER_QUESTION)))
+        for token in tokens:
+            node = self.root
+            node.count += 1
+            for char in token:
+                node = node.children.setdefault(char, TrieNode())
+                node.count += 1
+            node.ids[question_id] = None
+        self.questions[question_id] = text
+        self.tokens[question_id] = tokens
+
+    def remove(self, question_id):
+        """
+        Remove a question from the index. Unknown ids are ignored.
+
+        Args:
+        * question_id: Id of the question (int).
+        """
+        with self.lock:
+            self._remove(question_id)
+
+    def _remove(self, question_id):
+        if question_id not in self.questions:
+            return
+        for token in self.tokens.pop(question_id):
+            #Record the path so that nodes left empty can be pruned bottom-up.
+            path = [self.root]
+            for char in token:
+                path.append(path[-1].children[char])
+            del path[-1].ids[question_id]
+            for node in path:
+                node.count -= 1
+            for depth in range(len(token), 0, -1):
+                if path[depth].count > 0:
+                    break
+                del path[depth - 1].children[token[depth - 1]]
+        del self.questions[question_id]
+
+    def _find(self, token):
+        node = self.root
+        for char in token:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def search(self, term, limit=SUGGESTIONS_LIMIT):
+        """
+        Return up to 'limit' questions matching a partially typed search term.
+        The last word of the term is matched as a prefix; any earlier words must appear in the question as whole words.
+        Matches are ordered by the completed word (alphabetical, shorter words first), then oldest first.
+        If an earlier word is rarer than the prefix, its questions are scanned instead and matches are ordered oldest first.
+        At most MAX_POSTINGS_VISITED nodes/ids are examined, so very sparse matches may return fewer than 'limit' suggestions.
+
+        Args:
+        * term: Partially typed search term (str).
+        * limit: Maximum number of suggestions to return (int).
+
+        Returns:
+        * suggestions: List of {'id', 'question'} dictionaries.
+        """
+        tokens = tokenize(term)
+        if (len(tokens) == 0) or (limit <= 0):
+            return []
+        with self.lock:
+            prefix_node = self._find(tokens[-1])
+            if prefix_node is None:
+                return []
+            #Id sets of the completed words, rarest first.
+            words = []
+            for token in set(tokens[:-1]):
+                node = self._find(token)
+                if (node is None) or (len(node.ids) == 0):
+                    return []
+                words.append(node.ids)
+            words.sort(key=len)
+            if (len(words) > 0) and (len(words[0]) < prefix_node.count):
+                return self._search_word(words, tokens[-1], limit)
+            return self._search_prefix(prefix_node, words, limit)
+
+    def _search_prefix(self, node, words, limit):
+        #Depth-first walk of the prefix subtree, visiting children in character order.
+        suggestions = []
+        seen = set()
+        budget = MAX_POSTINGS_VISITED
+        stack = [node]
+        while stack and (len(suggestions) < limit) and (budget > 0):
+            node = stack.pop()
+            budget -= 1
+            for question_id in node.ids:
+                if (len(suggestions) >= limit) or (budget <= 0):
+                    break
+                budget -= 1
+                if question_id in seen:
+                    continue
+                for ids in words:
+                    if question_id not in ids:
+                        break
+                else:
+                    seen.add(question_id)
+                    suggestions.append(self._suggestion(question_id))
+            stack.extend(node.children[char] for char in sorted(node.children, reverse=True))
+        return suggestions
+
+    def _search_word(self, words, prefix, limit):
+        #Scan the rarest completed word's questions, checking the other words and the prefix per question.
+        #Each question's tokens are sorted, so the first token >= prefix is the only one that needs checking.
+        suggestions = []
+        others = words[1:]
+        for question_id in islice(words[0], MAX_POSTINGS_VISITED):
+            for ids in others:
+                if question_id not in ids:
+                    break
+            else:
+                tokens = self.tokens[question_id]
+                position = bisect_left(tokens, prefix)
+                if (position < len(tokens)) and tokens[position].startswith(prefix):
+                    suggestions.append(self._suggestion(question_id))
+                    if len(suggestions) >= limit:
+                        break
+        return suggestions
+
+    def _suggestion(self, question_id):
+        return {'id':question_id
+                ,'question':self.questions[question_id]}
@@ -0,0 +1,104 @@
+"""
+Latency benchmark for the autocomplete prefix index (autocomplete.py).
+Builds a QuestionTrie over synthetic questions (no database required) and times lookups.
+
+Usage: python benchmark_autocomplete.py [number_of_questions]
+"""
+import random
+import sys
+import time
+
+from autocomplete import QuestionTrie, SUGGESTIONS_LIMIT
+
+
+#Default number of synthetic questions to index (constant).
+BENCHMARK_QUESTIONS = 100000
+#Number of lookups timed per query type (constant).
+BENCHMARK_LOOKUPS = 10000
+#Question openers; each appears in ~20% of the synthetic questions, so their words are the most common tokens.
+OPENERS = ['What is', 'Who was', 'Which', 'In which year did', 'How many']
+
+
+def make_questions(count, seed=0):
+    """
+    Generate synthetic question text from a fixed vocabulary of random words.
+
+    Args:
+    * count: Number of questions to generate (int).
+    * seed: Seed for the random number generator (int).
+
+    Returns:
+    * questions: List of (id, question) tuples.
+    """
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    vocabulary = [''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(20000)]
+    return [(question_id, '{} {}?'.format(rng.choice(OPENERS), ' '.join(rng.choices(vocabulary, k=rng.randint(3, 8)))))
+            for question_id in range(1, count + 1)]
+
+
+def make_queries(questions, seed=1):
+    """
+    Generate search terms as they would be typed, grouped by query type.
+
+    Args:
+    * questions: List of (id, question) tuples (see make_questions()).
+    * seed: Seed for the random number generator (int).
+
+    Returns:
+    * queries: Dictionary of query type:list of search terms.
+    """
+    rng = random.Random(seed)
+    sample = [text.rstrip('?').lower().split() for _, text in rng.sample(questions, 1000)]
+    words = [word for question in sample for word in question]
+    openers = [opener.lower() for opener in OPENERS]
+    common_words = sorted({word for opener in openers for word in opener.split()})
+
+    def typed(words):
+        #Cut the last word at a random point, as if the user were part-way through typing it.
+        return ' '.join(words[:-1] + [words[-1][:rng.randint(1, len(words[-1]))]])
+
+    return {'1 word, prefix length 1':[rng.choice(words)[:1] for _ in range(BENCHMARK_LOOKUPS)]
+            ,'1 word, prefix length 3':[rng.choice(words)[:3] for _ in range(BENCHMARK_LOOKUPS)]
+            ,'1 common word':[typed([rng.choice(common_words)]) for _ in range(BENCHMARK_LOOKUPS)]
+            ,'opener + prefix':[typed(rng.choice(openers).split() + [rng.choice(words)]) for _ in range(BENCHMARK_LOOKUPS)]
+            ,'opener + 2 prefix letters':[rng.choice(openers) + ' ' + rng.choice(words)[:2] for _ in range(BENCHMARK_LOOKUPS)]
+            ,'partial question':[typed(rng.choice(sample)[:rng.randint(2, 6)]) for _ in range(BENCHMARK_LOOKUPS)]
+            ,'unrelated common words':[rng.choice(openers) + ' ' + rng.choice(common_words) for _ in range(BENCHMARK_LOOKUPS)]
+            ,'no match':[rng.choice(openers) + ' zzzz' for _ in range(BENCHMARK_LOOKUPS)]}
+
+
+def percentile(timings, fraction):
+    return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+
+def main(count=BENCHMARK_QUESTIONS):
+    questions = make_questions(count)
+    index = QuestionTrie(max_questions=count)
+
+    start = time.perf_counter()
+    for question_id, text in questions:
+        index.insert(question_id, text)
+    print('Indexed {} questions in {:.2f} s'.format(len(index), time.perf_counter() - start))
+
+    for query_type, queries in make_queries(questions).items():
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, SUGGESTIONS_LIMIT)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print('{:<28} median {:7.1f} us, p99 {:7.1f} us, max {:7.1f} us'.format(query_type
+                                                                              ,percentile(timings, 0.5) * 1e6
+                                                                              ,percentile(timings, 0.99) * 1e6
+                                                                              ,timings[-1] * 1e6))
+
+    start = time.perf_counter()
+    for question_id, _ in questions[:BENCHMARK_LOOKUPS]:
+        index.remove(question_id)
+    print('Removed {} questions in {:.1f} us each'.format(BENCHMARK_LOOKUPS
+                                                         ,(time.perf_counter() - start) / BENCHMARK_LOOKUPS * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else BENCHMARK_QUESTIONS)
@@ -5,10 +5,13 @@ from flask_cors import CORS
 import random
 
 from models import setup_db, Question, Category
+from autocomplete import QuestionTrie, SUGGESTIONS_LIMIT
 
 
 #Number of questions to display per page (constant).
 QUESTIONS_PER_PAGE = 10
+#Maximum number of suggestions a single autocomplete request may ask for (constant).
+MAX_SUGGESTIONS_LIMIT = 50
 
 
 def paginate_results(request, selection):
@@ -46,6 +49,15 @@ def create_app(test_config=None):
     app = Flask(__name__)
     setup_db(app)
 
+    #In-memory prefix index (autocomplete.py) used for as-you-type search suggestions.
+    #Built from the database on first use (so it reflects the final database binding), then kept in sync by create_question() and delete_question().
+    #Note: The index lives in this process only - changes handled by other worker processes are not seen until restart.
+    question_index = QuestionTrie()
+
+    def get_question_index():
+        question_index.ensure_built(lambda: Question.query.order_by(Question.id).all())
+        return question_index
+
     
     """
     @TODO: Set up CORS. Allow '*' for origins. Delete the sample route after completing the TODOs
@@ -161,6 +173,7 @@ def create_app(test_config=None):
             except:
                 abort(404)
             question.delete()
+            get_question_index().remove(question_id)
             return jsonify({'success':True
                             ,'deleted':question_id})
         except:
@@ -211,6 +224,7 @@ def create_app(test_config=None):
                                     ,category=response_data['category']
                                     ,difficulty=response_data['difficulty'])
             new_question.insert()
+            get_question_index().insert(new_question.id, new_question.question)
             #Get updated overall question metrics.
             questions = Question.query.all()
             questions_paginated = paginate_results(request, questions) 
@@ -264,6 +278,35 @@ def create_app(test_config=None):
             abort(404)    
     
 
+    @app.route('/questions/autocomplete', methods=['GET'])
+    def autocomplete_questions():
+        """
+        Return question suggestions for a partially typed searchTerm (str), served from the in-memory prefix index.
+        The last word of searchTerm is matched as a prefix; earlier words must appear in the question as whole words.
+        Optional 'limit' (int) sets the number of suggestions returned (default SUGGESTIONS_LIMIT, max MAX_SUGGESTIONS_LIMIT).
+        Frontend request: getSuggestions() (QuestionView.js).
+
+        Returns:
+        * JSON object: {'success', 'suggestions', 'total_suggestions'}.
+        """
+        search_term = request.args.get('searchTerm', None, type=str)
+        #Check if searchTerm is not in the request, or if 'limit' is not a valid integer within range.
+        #Note: 'limit' is cast manually, as request.args.get(type=int) silently returns the default for invalid values.
+        #If true, abort.
+        try:
+            limit = int(request.args.get('limit', SUGGESTIONS_LIMIT))
+        except ValueError:
+            abort(400)
+        if (search_term is None)\
+        or ((limit < 1) or (limit > MAX_SUGGESTIONS_LIMIT)):
+            abort(400)
+
+        suggestions = get_question_index().search(search_term, limit)
+        return jsonify({'success':True
+                        ,'suggestions':suggestions
+                        ,'total_suggestions':len(suggestions)})
+
+
     """
     @TODO:
     Create a GET endpoint to get questions based on category.
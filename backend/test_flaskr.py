@@ -5,6 +5,7 @@ from flask_sqlalchemy import SQLAlchemy
 
 from flaskr import create_app
 from models import setup_db, Question, Category
+from autocomplete import QuestionTrie, MAX_TOKEN_LENGTH, MAX_TOKENS_PER_QUESTION, MAX_QUESTION_LENGTH
 
 
 class TriviaTestCase(unittest.TestCase):
@@ -147,8 +148,86 @@ class TriviaTestCase(unittest.TestCase):
         self.assertEqual(data['success'], False)
         self.assertEqual(data['message'], 'Bad request - server unable to process.')
         self.assertEqual(data['error'], 400)
-        
-        
+
+
+    #autocomplete_questions().
+    def test__autocomplete_questions__pass(self):
+        response = self.client().get('/questions/autocomplete?searchTerm=titl')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['success'], True)
+        self.assertTrue(data['total_suggestions']) #Note: prefix 'titl' is known to match 'title'.
+        self.assertEqual(data['total_suggestions'], len(data['suggestions']))
+        self.assertTrue('title' in data['suggestions'][0]['question'].lower())
+
+    def test__autocomplete_questions__pass_kept_in_sync(self):
+        """
+        Suggestions reflect questions created and deleted through the API.
+        """
+        new_question = {'question':'Which zyzzyva-eating bird is the subject of this test?'
+                        ,'answer':'None'
+                        ,'category':1
+                        ,'difficulty':1}
+        created = json.loads(self.client().post('/questions', json=new_question).data)['created']
+        data = json.loads(self.client().get('/questions/autocomplete?searchTerm=zyzz').data)
+        self.assertEqual([x['id'] for x in data['suggestions']], [created])
+        self.client().delete('/questions/{}'.format(created))
+        data = json.loads(self.client().get('/questions/autocomplete?searchTerm=zyzz').data)
+        self.assertEqual(data['suggestions'], [])
+
+    def test__autocomplete_questions__fail_400_limit_outside_range(self):
+        """
+        Request more suggestions than MAX_SUGGESTIONS_LIMIT allows.
+        """
+        response = self.client().get('/questions/autocomplete?searchTerm=titl&limit=100000')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['message'], 'Bad request - server unable to process.')
+        self.assertEqual(data['error'], 400)
+
+    def test__autocomplete_questions__fail_400_limit_zero(self):
+        """
+        Request zero suggestions.
+        """
+        response = self.client().get('/questions/autocomplete?searchTerm=titl&limit=0')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['error'], 400)
+
+    def test__autocomplete_questions__fail_400_limit_not_integer(self):
+        """
+        Supply a 'limit' value that is not an integer.
+        """
+        response = self.client().get('/questions/autocomplete?searchTerm=titl&limit=abc')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['error'], 400)
+
+    def test__autocomplete_questions__fail_400_limit_unicode_digit(self):
+        """
+        Supply a 'limit' value that str.isdigit() accepts but int() cannot convert ('²').
+        """
+        response = self.client().get('/questions/autocomplete?searchTerm=titl&limit=%C2%B2')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['error'], 400)
+
+    def test__autocomplete_questions__fail_400_omit_searchTerm(self):
+        """
+        Omit 'searchTerm' from the query string.
+        """
+        response = self.client().get('/questions/autocomplete')
+        data = json.loads(response.data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['success'], False)
+        self.assertEqual(data['message'], 'Bad request - server unable to process.')
+        self.assertEqual(data['error'], 400)
+
+
     #get_questions_by_category().
     def test__get_questions_by_category__pass(self):
         response = self.client().get('/categories/1/questions')
@@ -193,6 +272,112 @@ class TriviaTestCase(unittest.TestCase):
         self.assertEqual(data['error'], 404)
 
 
+class QuestionTrieTestCase(unittest.TestCase):
+    """This class represents the autocomplete index test case (no database required)"""
+
+    def setUp(self):
+        """Define test variables and initialize index."""
+        self.index = QuestionTrie()
+        self.index.insert(1, 'What is the capital of Australia?')
+        self.index.insert(2, 'Whose autobiography is entitled I Know Why the Caged Bird Sings?')
+        self.index.insert(3, 'What boxer\'s original name is Cassius Clay?')
+        self.index.insert(4, 'What is the capital city of Pelé\'s home country?')
+
+    def ids(self, term, limit=10):
+        return [x['id'] for x in self.index.search(term, limit)]
+
+    #search().
+    def test__search__pass_ordered_by_word_then_oldest(self):
+        #'cap' completes only to 'capital' (1, 4); 'ca' also reaches 'caged' (2) and 'cassius' (3), which sort first.
+        self.assertEqual(self.ids('cap'), [1, 4])
+        self.assertEqual(self.ids('ca'), [2, 1, 4, 3])
+        self.assertEqual(self.index.search('cap', 1), [{'id':1, 'question':'What is the capital of Australia?'}])
+
+    def test__search__pass_multiple_words(self):
+        """
+        Earlier words must appear as whole words; the last word is a prefix.
+        """
+        self.assertEqual(self.ids('what is the cap'), [1, 4])
+        self.assertEqual(self.ids('the capital ci'), [4])
+        self.assertEqual(self.ids('whose cap'), [])
+        self.assertEqual(self.ids('wha bo'), []) #Note: 'wha' is not a whole word.
+
+    def test__search__pass_unicode_and_apostrophes(self):
+        self.assertEqual(self.ids('pelé'), [4])
+        self.assertEqual(self.ids('PELÉ\'S'), [4])
+        self.assertEqual(self.ids('boxer\'s'), [3])
+
+    def test__search__fail_no_match(self):
+        self.assertEqual(self.ids('zzz'), [])
+        self.assertEqual(self.ids('  ?! '), [])
+        self.assertEqual(self.ids('cap', 0), [])
+
+    #insert().
+    def test__insert__pass_replaces_existing_id(self):
+        self.index.insert(1, 'Which planet is closest to the sun?')
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.ids('cap'), [4])
+        self.assertEqual(self.ids('plan'), [1])
+
+    def test__insert__pass_truncates_long_tokens(self):
+        word = 'x' * (MAX_TOKEN_LENGTH + 10)
+        self.index.insert(5, word)
+        self.assertEqual(self.index.tokens[5], ('x' * MAX_TOKEN_LENGTH,))
+        self.assertEqual(self.ids(word), [5])
+
+    def test__insert__pass_caps_words_and_text_per_question(self):
+        """
+        Long questions are truncated, so memory per question is bounded.
+        """
+        words = ['word{}'.format(x) for x in range(MAX_TOKENS_PER_QUESTION + 10)]
+        self.index.insert(5, ' '.join(words))
+        self.assertEqual(len(self.index.tokens[5]), MAX_TOKENS_PER_QUESTION)
+        self.assertEqual(self.ids(words[0]), [5])
+        self.assertEqual(self.ids(words[-1]), [])
+        self.index.insert(6, 'a' * (MAX_QUESTION_LENGTH * 2))
+        self.assertEqual(len(self.index.questions[6]), MAX_QUESTION_LENGTH)
+
+    def test__insert__pass_evicts_oldest_when_full(self):
+        """
+        The index never holds more than max_questions questions; the oldest is evicted to make room.
+        """
+        index = QuestionTrie(max_questions=2)
+        index.insert(1, 'alpha')
+        index.insert(2, 'beta')
+        index.insert(3, 'gamma')
+        self.assertEqual(len(index), 2)
+        self.assertEqual([x['id'] for x in index.search('alpha')], [])
+        self.assertEqual([x['id'] for x in index.search('gamma')], [3])
+        self.assertEqual(list(index.root.children), ['b', 'g'])
+
+    #remove().
+    def test__remove__pass_prunes_empty_branches(self):
+        self.index.remove(1)
+        self.assertEqual(self.ids('aus'), [])
+        self.assertFalse('s' in self.index.root.children['a'].children['u'].children) #Note: 'australia' was the only 'aus' word.
+        for question_id in [2, 3, 4]:
+            self.index.remove(question_id)
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.root.children, {})
+        self.assertEqual(self.index.root.count, 0)
+
+    def test__remove__pass_unknown_id(self):
+        self.index.remove(100000)
+        self.assertEqual(len(self.index), 4)
+
+    #build().
+    def test__build__pass_replaces_contents(self):
+        class Row:
+            def __init__(self, id, question):
+                self.id = id
+                self.question = question
+        self.index.build([Row(10, 'Who discovered penicillin?')])
+        self.assertTrue(self.index.built)
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.ids('cap'), [])
+        self.assertEqual(self.ids('pen'), [10])
+
+
 # Make the tests conveniently executable
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -108,6 +108,21 @@ class QuestionView extends Component {
     });
   };
 
+  getSuggestions = (searchTerm, callback) => {
+    $.ajax({
+      url: `/questions/autocomplete?searchTerm=${encodeURIComponent(searchTerm)}`,
+      type: 'GET',
+      success: (result) => {
+        callback(result.suggestions);
+        return;
+      },
+      error: (error) => {
+        callback([]);
+        return;
+      },
+    });
+  };
+
   questionAction = (id) => (action) => {
     if (action === 'DELETE') {
       if (window.confirm('are you sure you want to delete the question?')) {
@@ -154,7 +169,10 @@ class QuestionView extends Component {
               </li>
             ))}
           </ul>
-          <Search submitSearch={this.submitSearch} />
+          <Search
+            submitSearch={this.submitSearch}
+            getSuggestions={this.getSuggestions}
+          />
         </div>
         <div className='questions-list'>
           <h2>Questions</h2>
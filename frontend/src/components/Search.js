@@ -1,19 +1,68 @@
 import React, { Component } from 'react';
 
+// Wait this long after the last keystroke before requesting suggestions.
+const SUGGESTION_DELAY_MS = 150;
+
 class Search extends Component {
   state = {
     query: '',
+    suggestions: [],
+  };
+
+  // Incremented for every suggestion request and whenever suggestions are closed,
+  // so responses that arrive late are dropped.
+  suggestionRequest = 0;
+
+  componentWillUnmount() {
+    clearTimeout(this.suggestionTimer);
+    this.suggestionRequest += 1;
+  }
+
+  closeSuggestions = () => {
+    clearTimeout(this.suggestionTimer);
+    this.suggestionRequest += 1;
+    this.setState({ suggestions: [] });
   };
 
   getInfo = (event) => {
     event.preventDefault();
+    this.closeSuggestions();
     this.props.submitSearch(this.state.query);
   };
 
+  getSuggestions = () => {
+    const query = this.state.query;
+    if (query.trim().length === 0) {
+      this.setState({ suggestions: [] });
+      return;
+    }
+    const request = ++this.suggestionRequest;
+    this.props.getSuggestions(query, (suggestions) => {
+      if (request === this.suggestionRequest) {
+        this.setState({ suggestions: suggestions });
+      }
+    });
+  };
+
   handleInputChange = () => {
     this.setState({
       query: this.search.value,
     });
+    clearTimeout(this.suggestionTimer);
+    this.suggestionTimer = setTimeout(this.getSuggestions, SUGGESTION_DELAY_MS);
+  };
+
+  handleKeyDown = (event) => {
+    if (event.key === 'Escape') {
+      this.closeSuggestions();
+    }
+  };
+
+  selectSuggestion = (suggestion) => {
+    this.closeSuggestions();
+    this.search.value = suggestion.question;
+    this.setState({ query: suggestion.question });
+    this.props.submitSearch(suggestion.question);
   };
 
   render() {
@@ -23,7 +72,26 @@ class Search extends Component {
           placeholder='Search questions...'
           ref={(input) => (this.search = input)}
           onChange={this.handleInputChange}
+          onKeyDown={this.handleKeyDown}
+          onBlur={this.closeSuggestions}
+          autoComplete='off'
         />
+        {this.state.suggestions.length > 0 && (
+          <ul className='search-suggestions'>
+            {this.state.suggestions.map((s) => (
+              <li
+                key={s.id}
+                // onMouseDown fires before the input's onBlur closes the list.
+                onMouseDown={(event) => {
+                  event.preventDefault();
+                  this.selectSuggestion(s);
+                }}
+              >
+                {s.question}
+              </li>
+            ))}
+          </ul>
+        )}
         <input type='submit' value='Submit' className='button' />
       </form>
     );